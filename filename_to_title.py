@@ -1,8 +1,9 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# PDF
-from PyPDF2 import PdfReader, PdfWriter
+# PDF (pypdf is PyPDF2's successor; clone_from/metadata need 3.x)
+from pypdf import PdfReader, PdfWriter
 
 # DOCX
 from docx import Document
@@ -13,11 +14,16 @@ from mutagen.id3 import ID3, TIT2
 from mutagen.mp3 import MP3
 
 def set_pdf_title(file_path, title):
-    reader = PdfReader(file_path)
-    writer = PdfWriter()
-    writer.append_pages_from_reader(reader)
-    metadata = reader.metadata or {}
-    metadata.update({"/Title": title})
+    # Cheap read-only check first: rewriting the PDF is pointless (and slow)
+    # when the title is already correct
+    if (PdfReader(file_path).metadata or {}).get("/Title") == title:
+        print(f"[PDF] Title already set — {file_path.name}")
+        return
+    # clone_from copies the document structure in one pass instead of
+    # appending every page through the reader
+    writer = PdfWriter(clone_from=str(file_path))
+    metadata = dict(writer.metadata or {})
+    metadata["/Title"] = title
     writer.add_metadata(metadata)
     with open(file_path, "wb") as f:
         writer.write(f)
@@ -26,6 +32,9 @@ def set_pdf_title(file_path, title):
 def set_docx_title(file_path, title):
     doc = Document(file_path)
     props = doc.core_properties
+    if props.title == title:
+        print(f"[DOCX] Title already set — {file_path.name}")
+        return
     props.title = title
     doc.save(file_path)
     print(f"[DOCX] Title updated → {title}")
@@ -36,25 +45,43 @@ def set_mp3_title(file_path, title):
         audio.add_tags()
     except Exception:
         pass
+    existing = audio.tags.get("TIT2")
+    if existing and existing.text and str(existing.text[0]) == title:
+        print(f"[MP3] Title already set — {file_path.name}")
+        return
     audio["TIT2"] = TIT2(encoding=3, text=title)
     audio.save()
     print(f"[MP3] Title updated → {title}")
 
+# suffix -> title setter; computed once instead of chained suffix checks per file
+DISPATCH = {".pdf": set_pdf_title, ".docx": set_docx_title, ".mp3": set_mp3_title}
+
+def iter_supported(folder):
+    # os.scandir avoids the per-entry stat + Path allocation of Path.glob
+    with os.scandir(folder) as it:
+        for entry in it:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            path = Path(entry.path)
+            setter = DISPATCH.get(path.suffix.lower())
+            if setter is not None:
+                yield path, setter
+
+def _worker(job):
+    file_path, setter = job
+    try:
+        setter(file_path, file_path.stem)
+    except Exception as e:
+        print(f"⚠️ Error updating {file_path.name}: {e}")
+
 def main(folder):
-    supported_exts = {".pdf", ".docx", ".mp3"}
-    for file_path in Path(folder).glob("*"):
-        if file_path.suffix.lower() not in supported_exts:
-            continue
-        title = file_path.stem
-        try:
-            if file_path.suffix.lower() == ".pdf":
-                set_pdf_title(file_path, title)
-            elif file_path.suffix.lower() == ".docx":
-                set_docx_title(file_path, title)
-            elif file_path.suffix.lower() == ".mp3":
-                set_mp3_title(file_path, title)
-        except Exception as e:
-            print(f"⚠️ Error updating {file_path.name}: {e}")
+    jobs = list(iter_supported(folder))
+    if not jobs:
+        return
+    # PDF/DOCX rewrites are CPU-bound (stream compression), so spread the
+    # files over processes; chunksize keeps IPC overhead down for short jobs
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(_worker, jobs, chunksize=8))
 
 if __name__ == "__main__":
     folder_to_process = input("Enter folder path: ").strip('"')
@@ -4,6 +4,9 @@
 MP3 Cover & Album Finder (no API keys)
 
 What's new in this build
+- Async pipeline: all iTunes/MusicBrainz/CoverArtArchive lookups run on an
+  asyncio event loop with one shared aiohttp session, so hundreds of requests
+  overlap instead of blocking one thread each.
 - Works even when you only have Title + Contributing Artist (no album).
 - Pulls album name from iTunes or MusicBrainz when possible and writes TALB.
 - Flags:
@@ -17,29 +20,118 @@ Sources
 """
 
 import argparse
-import concurrent.futures
-import io
+import asyncio
 import json
 import os
 import random
 import re
+import sqlite3
 import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 
-import requests
+import aiohttp
 from mutagen.id3 import ID3, APIC, TALB, TPE1, TPE2, TIT2, ID3NoHeaderError, error as ID3Error
 
+try:
+    import orjson  # C JSON parser, 2-5x faster on the big search payloads
+except ImportError:
+    orjson = None
+
 # -------- Config --------
 USER_AGENT = "MP3CoverFinder/1.1 (+https://example.local)"
 ITUNES_SEARCH = "https://itunes.apple.com/search"
 MB_BASE = "https://musicbrainz.org/ws/2"
 
-def sleep_backoff(base=0.5, factor=1.7, jitter=0.3, attempt=0):
+# "Artist - Title" filename heuristic, compiled once
+_ARTIST_TITLE_RE = re.compile(r"(.+?)\s*-\s*(.+)$")
+
+CACHE_PATH = Path("~/.cache/mp3cover/http_cache.sqlite3").expanduser()
+JSON_TTL = 30 * 86400    # search results go stale slowly
+IMAGE_TTL = 90 * 86400   # artwork is effectively immutable per URL
+
+def backoff_delay(base=0.5, factor=1.7, jitter=0.3, attempt=0):
     t = base * (factor ** attempt) + random.uniform(0, jitter)
-    time.sleep(min(t, 5.0))
+    return min(t, 5.0)
+
+# -------- Rate limiting --------
+
+class RateLimiter:
+    """Paces requests to N per `per` seconds so we respect provider rate
+    policies up front instead of eating 429/503 retry backoff."""
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self._interval = per / rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+MB_LIMITER = RateLimiter(1, 1.0)      # MusicBrainz policy: 1 req/sec
+CAA_LIMITER = RateLimiter(5, 1.0)
+ITUNES_LIMITER = RateLimiter(20, 1.0)
+
+async def pace(url: str):
+    if "musicbrainz.org" in url:
+        await MB_LIMITER.wait()
+    elif "coverartarchive.org" in url:
+        await CAA_LIMITER.wait()
+    elif "itunes.apple.com" in url:
+        await ITUNES_LIMITER.wait()
+
+# -------- Response cache --------
+
+_cache_db: Optional[sqlite3.Connection] = None
+
+def _cache() -> Optional[sqlite3.Connection]:
+    global _cache_db
+    if _cache_db is None:
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _cache_db = sqlite3.connect(CACHE_PATH)
+            _cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache "
+                "(key TEXT PRIMARY KEY, content_type TEXT, body BLOB, ts INTEGER)"
+            )
+            _cache_db.commit()
+        except Exception:
+            _cache_db = None  # cache is best-effort; run without it
+    return _cache_db
+
+def _cache_key(url: str, params: Dict[str, Any] = None) -> str:
+    return url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+
+def cache_get(url: str, params: Dict[str, Any], ttl: int):
+    db = _cache()
+    if db is None:
+        return None
+    try:
+        row = db.execute("SELECT content_type, body, ts FROM http_cache WHERE key = ?",
+                         (_cache_key(url, params),)).fetchone()
+    except Exception:
+        return None
+    if not row or row[2] < time.time() - ttl:
+        return None
+    return {"Content-Type": row[0] or ""}, row[1]
+
+def cache_put(url: str, params: Dict[str, Any], content_type: str, body: bytes):
+    db = _cache()
+    if db is None:
+        return
+    try:
+        db.execute("INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?)",
+                   (_cache_key(url, params), content_type, body, int(time.time())))
+        db.commit()
+    except Exception:
+        pass
 
 # -------- Utilities --------
 
@@ -52,22 +144,110 @@ def human_bytes(n: int) -> str:
             return f"{f:.1f}{unit}"
         f /= 1024.0
 
-def http_get(url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None, timeout=12, stream=False, max_attempts=3):
-    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+async def http_get(session: aiohttp.ClientSession, url: str, params: Dict[str, Any] = None,
+                   headers: Dict[str, str] = None, timeout=12, max_attempts=3):
+    """GET url, returning (headers, body bytes). Retries transient failures."""
     for attempt in range(max_attempts):
+        await pace(url)
         try:
-            r = requests.get(url, params=params, headers=headers, timeout=timeout, stream=stream)
-            if r.status_code in (429, 500, 502, 503, 504):
-                sleep_backoff(attempt=attempt)
-                continue
-            r.raise_for_status()
-            return r
-        except requests.RequestException:
+            async with session.get(url, params=params, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+                if r.status in (429, 500, 502, 503, 504):
+                    await asyncio.sleep(backoff_delay(attempt=attempt))
+                    continue
+                r.raise_for_status()
+                return r.headers, await r.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             if attempt == max_attempts - 1:
                 raise
-            sleep_backoff(attempt=attempt)
+            await asyncio.sleep(backoff_delay(attempt=attempt))
     raise RuntimeError("Unreachable")
 
+async def http_head(session: aiohttp.ClientSession, url: str, timeout=12):
+    """HEAD url, returning (status, headers). Lets callers size-check before a GET."""
+    await pace(url)
+    async with session.head(url, allow_redirects=True,
+                            timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        return r.status, r.headers
+
+async def cached_http_get(session, url: str, params: Dict[str, Any] = None,
+                          headers: Dict[str, str] = None, ttl: int = JSON_TTL):
+    """http_get with an on-disk cache so reruns and same-album tracks skip the network."""
+    hit = cache_get(url, params, ttl)
+    if hit is not None:
+        return hit
+    hdrs, body = await http_get(session, url, params=params, headers=headers)
+    cache_put(url, params, hdrs.get("Content-Type", ""), body)
+    return hdrs, body
+
+MAX_IMAGE_BYTES = 6_000_000
+
+def sniff_mime(b: bytes) -> Optional[str]:
+    """Canonical MIME from the magic bytes; None for anything that isn't an
+    image (e.g. an HTML error page served with an image Content-Type)."""
+    if b.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if b.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if len(b) >= 12 and b[:4] == b"RIFF" and b[8:12] == b"WEBP":
+        return "image/webp"
+    if b[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return None
+
+async def read_image_bounded(resp, min_bytes: int, max_bytes: int) -> Optional[bytes]:
+    """Stream a response body, aborting once it exceeds max_bytes; None if out of bounds."""
+    buf = bytearray()
+    async for chunk in resp.content.iter_chunked(65536):
+        buf.extend(chunk)
+        if len(buf) > max_bytes:
+            resp.close()
+            return None
+    if len(buf) < min_bytes:
+        return None
+    return bytes(buf)
+
+async def fetch_image(session, url: str, min_bytes: int,
+                      max_bytes: int = MAX_IMAGE_BYTES, max_attempts=3) -> Optional[Tuple[bytes, str]]:
+    """Bounded, cached image download. Returns (bytes, content_type) or None."""
+    hit = cache_get(url, None, IMAGE_TTL)
+    if hit is not None:
+        hdrs, body = hit
+        if min_bytes <= len(body) <= max_bytes:
+            return body, hdrs.get("Content-Type", "")
+        return None
+    for attempt in range(max_attempts):
+        await pace(url)
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=12)) as r:
+                if r.status in (429, 500, 502, 503, 504):
+                    await asyncio.sleep(backoff_delay(attempt=attempt))
+                    continue
+                r.raise_for_status()
+                ct = r.headers.get("Content-Type", "").lower()
+                if "image" not in ct:
+                    return None
+                content = await read_image_bounded(r, min_bytes, max_bytes)
+                if content is None:
+                    return None
+                # Trust the magic bytes over the header — the sniffed MIME is
+                # what ends up inside the APIC frame
+                mime = sniff_mime(content[:16])
+                if mime is None:
+                    return None
+                cache_put(url, None, mime, content)
+                return content, mime
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == max_attempts - 1:
+                return None
+            await asyncio.sleep(backoff_delay(attempt=attempt))
+    return None
+
+def json_body(body: bytes):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 # -------- ID3 helpers --------
 
 @dataclass
@@ -76,15 +256,17 @@ class TrackMeta:
     album: Optional[str]
     title: Optional[str]
 
-def read_id3_meta(path: Path) -> TrackMeta:
+def load_id3(path: Path) -> ID3:
+    """Parse the tag once per file; an empty ID3 stands in for untagged/bad files."""
     try:
-        tags = ID3(path)
+        return ID3(path)
     except ID3NoHeaderError:
         # No tag yet
-        return TrackMeta(None, None, path.stem)
+        return ID3()
     except Exception:
-        return TrackMeta(None, None, path.stem)
+        return ID3()
 
+def read_id3_meta(tags: ID3, path: Path) -> TrackMeta:
     def get_text(frame_id: str) -> Optional[str]:
         f = tags.getall(frame_id)
         for x in f:
@@ -100,20 +282,15 @@ def read_id3_meta(path: Path) -> TrackMeta:
     title = get_text("TIT2") or path.stem
     return TrackMeta(artist, album, title)
 
-def has_embedded_art(path: Path) -> bool:
+def has_embedded_art(tags: ID3) -> bool:
     try:
-        tags = ID3(path)
         return any(tags.getall("APIC"))
     except Exception:
         return False
 
-def write_album_tag(path: Path, album: str, force=False) -> bool:
+def stage_album_tag(tags: ID3, album: str, force=False) -> bool:
+    """Stage a TALB update in memory; the caller flushes with save_tags."""
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
         existing = None
         for t in tags.getall("TALB"):
             try:
@@ -128,34 +305,44 @@ def write_album_tag(path: Path, album: str, force=False) -> bool:
 
         tags.delall("TALB")
         tags.add(TALB(encoding=3, text=album))
-        tags.save(path, v2_version=3)
         return True
     except Exception:
         return False
 
-def embed_cover(path: Path, image_bytes: bytes, mime: str, force_id3v24=False) -> bool:
+def stage_cover(tags: ID3, image_bytes: bytes, mime: str) -> bool:
+    """Stage an APIC update in memory; the caller flushes with save_tags."""
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
         if not mime or "/" not in mime:
             mime = "image/jpeg"
         tags.delall("APIC")
         tags.add(APIC(encoding=3, mime=mime, type=3, desc="Front cover", data=image_bytes))
-        tags.save(path, v2_version=4 if force_id3v24 else 3)
         return True
     except ID3Error:
         return False
 
+def _tag_padding(info) -> int:
+    # Keep existing padding so mutagen can save in place (no full-file
+    # rewrite), and when the tag outgrows its slot reserve extra headroom
+    # so the *next* cover/album update fits without another rewrite.
+    if info.padding >= 0:
+        return info.padding
+    return max(1024, -info.padding + 4096)
+
+def save_tags(tags: ID3, path: Path, id3v24=False) -> bool:
+    """Single flush per file so album and cover updates share one rewrite."""
+    try:
+        tags.save(path, v2_version=4 if id3v24 else 3, padding=_tag_padding)
+        return True
+    except Exception:
+        return False
+
 # -------- Fetchers --------
 
 def upscale_itunes_art(url: str, target: int = 1200) -> str:
     # iTunes artwork URLs have size in the path, e.g. /100x100bb.jpg
     return re.sub(r"/\d+x\d+bb\.", f"/{target}x{target}bb.", url)
 
-def itunes_search(artist: Optional[str], album: Optional[str], title: Optional[str]):
+async def itunes_search(session, artist: Optional[str], album: Optional[str], title: Optional[str]):
     """Return list of dicts with keys: image_bytes, content_type, source, album_title"""
     candidates = []
     queries = []
@@ -168,10 +355,17 @@ def itunes_search(artist: Optional[str], album: Optional[str], title: Optional[s
     if title:
         queries.append({"term": f"{title}", "entity": "song", "limit": 5})
 
-    for q in queries:
+    # Fire all query variants at once; results are still ranked in query order
+    responses = await asyncio.gather(
+        *(cached_http_get(session, ITUNES_SEARCH, params={"media": "music", **q}) for q in queries),
+        return_exceptions=True,
+    )
+    for resp in responses:
+        if isinstance(resp, BaseException):
+            continue
         try:
-            r = http_get(ITUNES_SEARCH, params={"media": "music", **q})
-            data = r.json()
+            _, body = resp
+            data = json_body(body)
         except Exception:
             continue
         for item in data.get("results", []):
@@ -182,13 +376,22 @@ def itunes_search(artist: Optional[str], album: Optional[str], title: Optional[s
             for size in (1200, 1000, 800, 600):
                 u = upscale_itunes_art(art_url, size)
                 try:
-                    img = http_get(u, stream=True)
-                    ct = img.headers.get("Content-Type", "").lower()
-                    if "image" not in ct:
-                        continue
-                    content = img.content
-                    if len(content) < 25_000:
+                    # Cheap HEAD probe first: reject wrong type / too-small sizes
+                    # from headers alone instead of downloading and discarding
+                    if cache_get(u, None, IMAGE_TTL) is None:
+                        try:
+                            status, hdrs = await http_head(session, u)
+                            if status < 400:
+                                ct = hdrs.get("Content-Type", "").lower()
+                                length = int(hdrs.get("Content-Length") or 0)
+                                if not ct.startswith("image/") or (length and length < 25_000):
+                                    continue
+                        except Exception:
+                            pass  # server may not support HEAD; fall back to GET
+                    got = await fetch_image(session, u, 25_000)
+                    if got is None:
                         continue
+                    content, ct = got
                     candidates.append({
                         "image_bytes": content,
                         "content_type": ct,
@@ -200,14 +403,38 @@ def itunes_search(artist: Optional[str], album: Optional[str], title: Optional[s
                     continue
     return candidates
 
-def mb_find_release_by_artist_title(artist: Optional[str], title: Optional[str]) -> Optional[Tuple[str, str]]:
-    """Search MusicBrainz recording by artist+title, return (release_mbid, release_title)."""
+# One-run memo for the MB searches: pure functions of their (normalized)
+# string arguments, so remixes/duplicate tracks reuse the in-flight task.
+# run_all clears it per run — entries cancelled at loop shutdown must not
+# leak into a later asyncio.run() in the same process
+_MB_MEMO: Dict[Tuple[str, str, str], asyncio.Task] = {}
+
+def _mb_memoized(kind: str, a: Optional[str], b: Optional[str], factory):
+    key = (kind, (a or "").strip().casefold(), (b or "").strip().casefold())
+    task = _MB_MEMO.get(key)
+    if task is None or task.cancelled():
+        task = asyncio.create_task(factory())
+        _MB_MEMO[key] = task
+    return asyncio.shield(task)
+
+async def mb_find_release_by_artist_title(session, artist: Optional[str], title: Optional[str]) -> Optional[Tuple[str, str]]:
     if not (artist and title):
         return None
+    return await _mb_memoized("recording", artist, title,
+                              lambda: _mb_find_release_by_artist_title(session, artist, title))
+
+async def mb_find_release_by_album_artist(session, artist: Optional[str], album: Optional[str]) -> Optional[Tuple[str, str]]:
+    if not album:
+        return None
+    return await _mb_memoized("release", artist, album,
+                              lambda: _mb_find_release_by_album_artist(session, artist, album))
+
+async def _mb_find_release_by_artist_title(session, artist: str, title: str) -> Optional[Tuple[str, str]]:
+    """Search MusicBrainz recording by artist+title, return (release_mbid, release_title)."""
     try:
         params = {"query": f'artist:"{artist}" AND recording:"{title}"', "fmt": "json", "limit": 1, "inc": "releases"}
-        r = http_get(f"{MB_BASE}/recording", params=params, headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"{MB_BASE}/recording", params=params, headers={"Accept": "application/json"})
+        data = json_body(body)
         recs = data.get("recordings") or []
         if not recs:
             return None
@@ -219,18 +446,16 @@ def mb_find_release_by_artist_title(artist: Optional[str], title: Optional[str])
     except Exception:
         return None
 
-def mb_find_release_by_album_artist(artist: Optional[str], album: Optional[str]) -> Optional[Tuple[str, str]]:
+async def _mb_find_release_by_album_artist(session, artist: Optional[str], album: str) -> Optional[Tuple[str, str]]:
     """Search MusicBrainz release by album (and optional artist)."""
-    if not album:
-        return None
     try:
         if artist:
             q = f'artist:"{artist}" AND release:"{album}"'
         else:
             q = f'release:"{album}"'
         params = {"query": q, "fmt": "json", "limit": 1}
-        r = http_get(f"{MB_BASE}/release", params=params, headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"{MB_BASE}/release", params=params, headers={"Accept": "application/json"})
+        data = json_body(body)
         rels = data.get("releases") or []
         if not rels:
             return None
@@ -239,11 +464,11 @@ def mb_find_release_by_album_artist(artist: Optional[str], album: Optional[str])
     except Exception:
         return None
 
-def caa_fetch_front(mbid: str) -> Optional[Tuple[bytes, str]]:
+async def caa_fetch_front(session, mbid: str) -> Optional[Tuple[bytes, str]]:
     # Use JSON to pick large thumbnails when possible
     try:
-        r = http_get(f"https://coverartarchive.org/release/{mbid}", headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"https://coverartarchive.org/release/{mbid}", headers={"Accept": "application/json"})
+        data = json_body(body)
         images = data.get("images", [])
         fronts = [img for img in images if img.get("front")] or images
         urls = []
@@ -257,52 +482,91 @@ def caa_fetch_front(mbid: str) -> Optional[Tuple[bytes, str]]:
                 urls.append(img["image"])
         for u in urls:
             try:
-                im = http_get(u, stream=True)
-                ct = im.headers.get("Content-Type", "").lower()
-                if "image" not in ct:
-                    continue
-                content = im.content
-                if len(content) < 20_000:
-                    continue
-                return content, ct
+                got = await fetch_image(session, u, 20_000)
+                if got is not None:
+                    return got
             except Exception:
                 continue
     except Exception:
         pass
     # final fallback
     try:
-        im = http_get(f"https://coverartarchive.org/release/{mbid}/front", stream=True)
-        ct = im.headers.get("Content-Type", "").lower()
-        if "image" in ct:
-            return im.content, ct
+        return await fetch_image(session, f"https://coverartarchive.org/release/{mbid}/front", 1)
     except Exception:
         return None
-    return None
 
-def find_cover_and_album(meta: TrackMeta):
-    """Return (image_bytes, content_type, source, album_title) or None."""
-    # iTunes first
-    it_cands = itunes_search(meta.artist, meta.album, meta.title)
+async def _itunes_path(session, meta: TrackMeta):
+    it_cands = await itunes_search(session, meta.artist, meta.album, meta.title)
     for c in it_cands:
         if c["image_bytes"]:
             return c["image_bytes"], c["content_type"], c["source"], c.get("album_title")
+    return None
 
-    # MusicBrainz paths
-    mb = None
-    album_title_from_mb = None
+async def _mb_path(session, meta: TrackMeta):
     # Prefer explicit album search if album given
-    mb = mb_find_release_by_album_artist(meta.artist, meta.album)
+    mb = await mb_find_release_by_album_artist(session, meta.artist, meta.album)
     if not mb and (meta.artist and meta.title):
-        mb = mb_find_release_by_artist_title(meta.artist, meta.title)
+        mb = await mb_find_release_by_artist_title(session, meta.artist, meta.title)
     if mb:
         mbid, album_title_from_mb = mb
-        caa = caa_fetch_front(mbid)
+        caa = await caa_fetch_front(session, mbid)
         if caa:
             img_bytes, ct = caa
             return img_bytes, ct, "CoverArtArchive", album_title_from_mb
+    return None
+
+async def race(coros, validate):
+    """Run coroutines concurrently and return the first result passing
+    validate, cancelling the losers so their in-flight requests close."""
+    pending = {asyncio.create_task(c) for c in coros}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    result = task.result()
+                except asyncio.CancelledError:
+                    # a provider dying mid-race (e.g. a stale memoized
+                    # task) is just a failed provider, not our cancellation
+                    continue
+                except Exception:
+                    continue
+                if validate(result):
+                    return result
+    finally:
+        for task in pending:
+            task.cancel()
+    return None
+
+def _valid_cover(result) -> bool:
+    return bool(result and result[0])
 
+async def find_cover_and_album(session, meta: TrackMeta):
+    """Return (image_bytes, content_type, source, album_title) or None.
+
+    Races iTunes against MusicBrainz+CAA and takes the first validated
+    image, cancelling whichever provider loses.
+    """
+    return await race((_itunes_path(session, meta), _mb_path(session, meta)),
+                      validate=_valid_cover)
+
+def group_key(meta: TrackMeta) -> Optional[Tuple[str, str]]:
+    """Tracks from the same album share one lookup; unknown albums stay per-track."""
+    if meta.artist and meta.album:
+        return meta.artist.strip().lower(), meta.album.strip().lower()
     return None
 
+async def lookup_cover(session, meta: TrackMeta, lookups: Dict[Tuple[str, str], asyncio.Task]):
+    """Memoized find_cover_and_album: one network lookup per (artist, album) group."""
+    key = group_key(meta)
+    if key is None:
+        return await find_cover_and_album(session, meta)
+    task = lookups.get(key)
+    if task is None:
+        task = asyncio.create_task(find_cover_and_album(session, meta))
+        lookups[key] = task
+    return await asyncio.shield(task)
+
 # -------- Pipeline --------
 
 @dataclass
@@ -315,22 +579,35 @@ class WorkResult:
     album_set: Optional[bool] = None
     album_value: Optional[str] = None
 
-def process_file(path: Path, args) -> WorkResult:
+async def process_file(path: Path, args, session, sem: asyncio.Semaphore,
+                       lookups: Dict[Tuple[str, str], asyncio.Task]) -> WorkResult:
     try:
         if path.suffix.lower() != ".mp3":
             return WorkResult(path, "skip", detail="not mp3")
 
+        # Parse the tag once and reuse it for every read/write below
+        tags = await asyncio.to_thread(load_id3, path)
+
         # We will still attempt album update even if art exists when requested
-        already_has_art = has_embedded_art(path)
+        already_has_art = has_embedded_art(tags)
 
         # Extract minimal meta; support "Artist - Title" filename heuristic
-        meta = read_id3_meta(path)
+        meta = read_id3_meta(tags, path)
         if not (meta.artist or meta.title or meta.album):
-            m = re.match(r"(.+?)\s*-\s*(.+)$", path.stem)
+            m = _ARTIST_TITLE_RE.match(path.stem)
             if m:
                 meta = TrackMeta(artist=m.group(1).strip(), album=None, title=m.group(2).strip())
 
-        found = find_cover_and_album(meta)
+        # Steady-state fast path: art present, not forcing, and a TALB already
+        # there (existing albums are never overwritten without --force), so
+        # the provider lookups would be thrown away — skip before any network
+        # I/O. Files missing an album still get the lookup: backfilling TALB
+        # is this tool's job even without --update-album.
+        if already_has_art and not args.force and meta.album:
+            return WorkResult(path, "skip", detail="already has art and album")
+
+        async with sem:
+            found = await lookup_cover(session, meta, lookups)
 
         album_set_flag = False
         album_value = None
@@ -338,17 +615,17 @@ def process_file(path: Path, args) -> WorkResult:
             _, _, _, album_title = found
             album_value = album_title
             if album_title and (args.update_album or not meta.album):
-                album_set_flag = write_album_tag(path, album_title, force=args.force)
+                album_set_flag = stage_album_tag(tags, album_title, force=args.force)
 
         if args.dry_run:
             if not found:
                 # Still report album attempt when not found
                 return WorkResult(path, "miss", detail="no cover/album found", album_set=False)
             img_bytes, mime, source, _ = found
-            action = "keep" if already_has_art and not args.force else "embed"
             return WorkResult(path, "found", source=source, bytes_written=len(img_bytes), album_set=album_set_flag, album_value=album_value)
 
         # If we already have art and not forcing, maybe skip embedding
+        embedded = False
         if already_has_art and not args.force:
             status = "skip"
             detail = "already has art"
@@ -356,25 +633,55 @@ def process_file(path: Path, args) -> WorkResult:
             if not found:
                 return WorkResult(path, "miss", detail="no cover/album found", album_set=album_set_flag)
             img_bytes, mime, source, _ = found
-            ok = embed_cover(path, img_bytes, mime, force_id3v24=args.id3v24)
-            status = "ok" if ok else "error"
-            detail = None if ok else "embed failed"
+            embedded = stage_cover(tags, img_bytes, mime)
+            status = "ok" if embedded else "error"
+            detail = None if embedded else "embed failed"
+
+        # One flush covers both the TALB and APIC updates
+        if album_set_flag or embedded:
+            if not await asyncio.to_thread(save_tags, tags, path, args.id3v24):
+                status, detail = "error", "tag save failed"
 
         return WorkResult(path, status, source=found[2] if found else None, detail=detail, bytes_written=(len(found[0]) if found else None), album_set=album_set_flag, album_value=album_value)
     except Exception as e:
         return WorkResult(path, "error", detail=str(e))
 
 def iter_mp3s(root: Path, recursive: bool):
-    if recursive:
-        yield from (p for p in root.rglob("*.mp3") if p.is_file())
-    else:
-        yield from (p for p in root.glob("*.mp3") if p.is_file())
+    # os.scandir gives us the file type from the dirent without the extra
+    # stat + Path allocation pathlib.glob pays per entry
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name[-4:].lower() == ".mp3" and entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path)
+
+async def run_all(files, args):
+    # Fresh memo per run: leftover tasks belong to the previous event loop
+    # and await-ing them from a new one only yields CancelledError
+    _MB_MEMO.clear()
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+    # Pool sized well above the file-level semaphore so every host keeps
+    # warm keep-alive connections even when one lookup fans out internally
+    pool = max(32, args.concurrency * 4)
+    connector = aiohttp.TCPConnector(limit=pool, limit_per_host=pool // 4,
+                                     keepalive_timeout=30, enable_cleanup_closed=True)
+    lookups: Dict[Tuple[str, str], asyncio.Task] = {}
+    async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}, connector=connector) as session:
+        return await asyncio.gather(*(process_file(p, args, session, sem, lookups) for p in files))
 
 def main():
     parser = argparse.ArgumentParser(description="Find & embed cover art; optionally set Album tag.")
     parser.add_argument("-p", "--path", type=str, required=True, help="Folder containing MP3 files")
     parser.add_argument("-r", "--recursive", action="store_true", help="Scan subfolders")
-    parser.add_argument("-n", "--concurrency", type=int, default=4, help="Parallel workers (not used in this simplified runner)")
+    parser.add_argument("-n", "--concurrency", type=int, default=4, help="Max files looked up in parallel")
     parser.add_argument("--force", action="store_true", help="Overwrite existing cover art and (with --update-album) album")
     parser.add_argument("--dry-run", action="store_true", help="Search & report only; do not embed")
     parser.add_argument("--id3v24", action="store_true", help="Save tags as ID3v2.4 (default v2.3)")
@@ -395,30 +702,27 @@ def main():
 
     ok = sk = miss = err = 0
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as ex:
-        futs = {ex.submit(process_file, p, args): p for p in files}
-        for fut in as_completed(futs):
-            res = fut.result()
-            if res.status == "ok":
-                ok += 1
-                extra = f", album={'set' if res.album_set else 'kept'}" if res.album_set is not None else ""
-                if res.album_value:
-                    extra += f" ('{res.album_value}')"
-                print(f"[OK] {res.path} ({res.source}, wrote {res.bytes_written} bytes){extra}")
-            elif res.status == "found":
-                extra = f", album would write '{res.album_value}'" if res.album_value else ""
-                print(f"[FOUND] {res.path} ({res.source}, would embed {res.bytes_written} bytes{extra})")
-            elif res.status == "skip":
-                sk += 1
-                extra = f"; album set to '{res.album_value}'" if res.album_set else ""
-                print(f"[SKIP] {res.path} ({res.detail}){extra}")
-            elif res.status == "miss":
-                miss += 1
-                print(f"[MISS] {res.path} ({res.detail})")
-            else:
-                err += 1
-                print(f"[ERR] {res.path} ({res.detail})")
+    results = asyncio.run(run_all(files, args))
+    for res in results:
+        if res.status == "ok":
+            ok += 1
+            extra = f", album={'set' if res.album_set else 'kept'}" if res.album_set is not None else ""
+            if res.album_value:
+                extra += f" ('{res.album_value}')"
+            print(f"[OK] {res.path} ({res.source}, wrote {res.bytes_written} bytes){extra}")
+        elif res.status == "found":
+            extra = f", album would write '{res.album_value}'" if res.album_value else ""
+            print(f"[FOUND] {res.path} ({res.source}, would embed {res.bytes_written} bytes{extra})")
+        elif res.status == "skip":
+            sk += 1
+            extra = f"; album set to '{res.album_value}'" if res.album_set else ""
+            print(f"[SKIP] {res.path} ({res.detail}){extra}")
+        elif res.status == "miss":
+            miss += 1
+            print(f"[MISS] {res.path} ({res.detail})")
+        else:
+            err += 1
+            print(f"[ERR] {res.path} ({res.detail})")
 
     print(f"\n[i] Done. ok={ok} skip={sk} miss={miss} err={err} of {len(files)}")
 
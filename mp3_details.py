@@ -22,68 +22,244 @@ Sources
 """
 
 import argparse
-import concurrent.futures
-import io
+import asyncio
+import hashlib
 import json
 import os
 import random
 import re
+import sqlite3
 import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
 
-import requests
+import aiohttp
 from mutagen.id3 import (
     ID3, APIC, TALB, TPE1, TPE2, TIT2, TCON, TDRC, TRCK,
     ID3NoHeaderError, error as ID3Error
 )
 
+try:
+    import orjson  # the MusicBrainz release payloads are the hottest parse
+except ImportError:
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz  # much faster scorer, but difflib works too
+except ImportError:
+    fuzz = None
+    import difflib
+
 # -------- Config --------
 USER_AGENT = "MP3CoverFinder/1.2 (+https://example.local)"
 ITUNES_SEARCH = "https://itunes.apple.com/search"
 MB_BASE = "https://musicbrainz.org/ws/2"
 
-def sleep_backoff(base=0.5, factor=1.7, jitter=0.3, attempt=0):
+# Shared with mp3_cover_finder so both tools hit the same cache
+CACHE_PATH = Path("~/.cache/mp3cover/http_cache.sqlite3").expanduser()
+JSON_TTL = 30 * 86400
+IMAGE_TTL = 90 * 86400
+
+# Compiled once; these run per candidate URL / per file
+_FNAME_RE = re.compile(r"(.+?)\s*-\s*(.+)$")
+_ITUNES_SIZE_RE = re.compile(r"/\d+x\d+bb\.")
+_PAREN_RE = re.compile(r"[\(\[].*?[\)\]]")
+_WS_RE = re.compile(r"\s+")
+
+def _norm(s: Optional[str]) -> str:
+    """Casefold and strip bracketed suffixes like '(feat. X)' so tag
+    variants of the same track share cache and group keys. API query
+    terms stay as-is — iTunes/MB do their own tokenizing."""
+    return _WS_RE.sub(" ", _PAREN_RE.sub("", s or "")).strip().casefold()
+
+def backoff_delay(base=0.5, factor=1.7, jitter=0.3, attempt=0):
     t = base * (factor ** attempt) + random.uniform(0, jitter)
-    time.sleep(min(t, 5.0))
+    return min(t, 5.0)
+
+# -------- Response cache --------
+
+_cache_db: Optional[sqlite3.Connection] = None
+# LRU over the JSON responses only: artwork lives in the disk cache, and
+# keeping covers in memory too would grow by hundreds of MB on big runs
+_mem_cache: "OrderedDict[str, Tuple[str, bytes, int]]" = OrderedDict()
+_MEM_CACHE_MAX_BODY = 512_000
+_MEM_CACHE_MAX_ENTRIES = 1024
+
+def _cache() -> Optional[sqlite3.Connection]:
+    global _cache_db
+    if _cache_db is None:
+        try:
+            CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _cache_db = sqlite3.connect(CACHE_PATH)
+            _cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache "
+                "(key TEXT PRIMARY KEY, content_type TEXT, body BLOB, ts INTEGER)"
+            )
+            _cache_db.execute(
+                "CREATE TABLE IF NOT EXISTS negative (key TEXT PRIMARY KEY, ts INTEGER)"
+            )
+            _cache_db.commit()
+        except Exception:
+            _cache_db = None  # cache is best-effort; run without it
+    return _cache_db
+
+def _cache_key(url: str, params: Dict[str, Any] = None) -> str:
+    return url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+
+def _mem_cache_put(key: str, content_type: str, body: bytes, ts: int):
+    # images stay on disk only; JSON bodies rotate through a capped LRU
+    if "image" in (content_type or "").lower() or len(body) > _MEM_CACHE_MAX_BODY:
+        return
+    _mem_cache[key] = (content_type, body, ts)
+    _mem_cache.move_to_end(key)
+    while len(_mem_cache) > _MEM_CACHE_MAX_ENTRIES:
+        _mem_cache.popitem(last=False)
+
+def cache_get(url: str, params: Dict[str, Any], ttl: int):
+    key = _cache_key(url, params)
+    row = _mem_cache.get(key)
+    if row is not None:
+        _mem_cache.move_to_end(key)  # refresh LRU position
+    else:
+        db = _cache()
+        if db is None:
+            return None
+        try:
+            row = db.execute("SELECT content_type, body, ts FROM http_cache WHERE key = ?",
+                             (key,)).fetchone()
+        except Exception:
+            return None
+    if not row or row[2] < time.time() - ttl:
+        return None
+    _mem_cache_put(key, row[0], row[1], row[2])
+    return {"Content-Type": row[0] or ""}, row[1]
+
+def cache_put(url: str, params: Dict[str, Any], content_type: str, body: bytes):
+    key = _cache_key(url, params)
+    _mem_cache_put(key, content_type, body, int(time.time()))
+    db = _cache()
+    if db is None:
+        return
+    try:
+        db.execute("INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?)",
+                   (key, content_type, body, int(time.time())))
+        db.commit()
+    except Exception:
+        pass
+
+NEGATIVE_TTL = 7 * 86400  # re-probe known-unfindable tracks weekly
+
+def negative_get(key: str, ttl: int = NEGATIVE_TTL) -> bool:
+    db = _cache()
+    if db is None:
+        return False
+    try:
+        row = db.execute("SELECT ts FROM negative WHERE key = ?", (key,)).fetchone()
+    except Exception:
+        return False
+    return bool(row) and row[0] >= time.time() - ttl
+
+def negative_put(key: str):
+    db = _cache()
+    if db is None:
+        return
+    try:
+        db.execute("INSERT OR REPLACE INTO negative VALUES (?, ?)", (key, int(time.time())))
+        db.commit()
+    except Exception:
+        pass
 
 # -------- Utilities --------
 
-def human_bytes(n: int) -> str:
-    if n is None:
-        return "?"
-    f = float(n)
-    for unit in ["B","KB","MB","GB"]:
-        if f < 1024.0 or unit == "GB":
-            return f"{f:.1f}{unit}"
-        f /= 1024.0
-
-def http_get(url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None, timeout=12, stream=False, max_attempts=3):
-    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+async def http_get(session: aiohttp.ClientSession, url: str, params: Dict[str, Any] = None,
+                   headers: Dict[str, str] = None, timeout=12, max_attempts=3):
+    """GET url, returning (headers, body bytes). Retries transient failures."""
     for attempt in range(max_attempts):
         try:
-            r = requests.get(url, params=params, headers=headers, timeout=timeout, stream=stream)
-            if r.status_code in (429, 500, 502, 503, 504):
-                # small backoff; also respect Retry-After if present
-                ra = r.headers.get("Retry-After")
-                if ra:
+            async with session.get(url, params=params, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+                if r.status in (429, 500, 502, 503, 504):
+                    # small backoff; also respect Retry-After if present
+                    ra = r.headers.get("Retry-After")
                     try:
-                        time.sleep(min(5.0, float(ra)))
+                        delay = min(5.0, float(ra)) if ra else backoff_delay(attempt=attempt)
                     except Exception:
-                        pass
-                else:
-                    sleep_backoff(attempt=attempt)
-                continue
-            r.raise_for_status()
-            return r
-        except requests.RequestException:
+                        delay = backoff_delay(attempt=attempt)
+                    await asyncio.sleep(delay)
+                    continue
+                r.raise_for_status()
+                return r.headers, await r.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             if attempt == max_attempts - 1:
                 raise
-            sleep_backoff(attempt=attempt)
+            await asyncio.sleep(backoff_delay(attempt=attempt))
     raise RuntimeError("Unreachable")
 
+async def cached_http_get(session, url: str, params: Dict[str, Any] = None,
+                          headers: Dict[str, str] = None, ttl: int = JSON_TTL):
+    """http_get with memory + disk caching; same-album tracks and reruns skip the network."""
+    hit = cache_get(url, params, ttl)
+    if hit is not None:
+        return hit
+    hdrs, body = await http_get(session, url, params=params, headers=headers)
+    cache_put(url, params, hdrs.get("Content-Type", ""), body)
+    return hdrs, body
+
+MAX_IMAGE_BYTES = 8_000_000  # hard cap while streaming candidate artwork
+
+async def fetch_image_bounded(session, url: str, min_bytes: int = 20_000,
+                              ttl: int = IMAGE_TTL, timeout=12):
+    """GET candidate artwork with the body streamed under a size cap.
+
+    Rejected candidates (wrong Content-Type, too small per Content-Length,
+    over the cap) cost headers or a partial body instead of a full
+    download. Returns (bytes, content_type) or None; only accepted images
+    go into the cache."""
+    hit = cache_get(url, None, ttl)
+    if hit is not None:
+        hdrs, body = hit
+        ct = hdrs.get("Content-Type", "").lower()
+        if "image" in ct and len(body) >= min_bytes:
+            return body, ct
+        return None
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+            if r.status != 200:
+                return None
+            ct = r.headers.get("Content-Type", "").lower()
+            if "image" not in ct:
+                return None
+            clen = r.headers.get("Content-Length")
+            if clen and (int(clen) < min_bytes or int(clen) > MAX_IMAGE_BYTES):
+                return None
+            content = bytearray()
+            async for chunk in r.content.iter_chunked(32768):
+                content.extend(chunk)
+                if len(content) > MAX_IMAGE_BYTES:
+                    return None
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+    if len(content) < min_bytes:
+        return None
+    body = bytes(content)
+    cache_put(url, None, ct, body)
+    return body, ct
+
+def _similarity(a: str, b: str) -> float:
+    """0-100 fuzzy match score between two metadata strings."""
+    if fuzz is not None:
+        return fuzz.WRatio(a, b)
+    return 100.0 * difflib.SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+def json_body(body: bytes):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
 # -------- ID3 helpers --------
 
 @dataclass
@@ -92,15 +268,18 @@ class TrackMeta:
     album: Optional[str]
     title: Optional[str]
 
-def read_id3_meta(path: Path) -> TrackMeta:
+def load_id3(path: Path) -> ID3:
+    """Parse the tag once per file; everything downstream works on the
+    returned object instead of re-opening the file."""
     try:
-        tags = ID3(path)
+        return ID3(path)
     except ID3NoHeaderError:
         # No tag yet
-        return TrackMeta(None, None, path.stem)
+        return ID3()
     except Exception:
-        return TrackMeta(None, None, path.stem)
+        return ID3()
 
+def read_id3_meta(tags: ID3, path: Path) -> TrackMeta:
     def get_text(frame_id: str) -> Optional[str]:
         f = tags.getall(frame_id)
         for x in f:
@@ -116,20 +295,15 @@ def read_id3_meta(path: Path) -> TrackMeta:
     title = get_text("TIT2") or path.stem
     return TrackMeta(artist, album, title)
 
-def has_embedded_art(path: Path) -> bool:
+def has_embedded_art_from_tags(tags: ID3) -> bool:
     try:
-        tags = ID3(path)
         return any(tags.getall("APIC"))
     except Exception:
         return False
 
-def _write_text_frame(path: Path, frame_cls, value: str, force=False) -> bool:
+def _stage_text_frame(tags: ID3, frame_cls, value: str, force=False) -> bool:
+    """Stage one text frame on an already-parsed tag; no save here."""
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
         existing = None
         for t in tags.getall(frame_cls.__name__):
             try:
@@ -138,80 +312,127 @@ def _write_text_frame(path: Path, frame_cls, value: str, force=False) -> bool:
             except Exception:
                 pass
 
+        if existing is not None and str(existing) == value:
+            # identical value: staging it would only force a file rewrite
+            return False
+
         if existing and not force:
             return False
 
         tags.delall(frame_cls.__name__)
         tags.add(frame_cls(encoding=3, text=value))
-        tags.save(path, v2_version=3)
         return True
     except Exception:
         return False
 
-def write_album_tag(path: Path, album: str, force=False) -> bool:
-    return _write_text_frame(path, TALB, album, force)
-
-def write_year_tag(path: Path, year_or_date: str, force=False) -> bool:
-    # TDRC can store YYYY or YYYY-MM or YYYY-MM-DD
-    return _write_text_frame(path, TDRC, year_or_date, force)
-
-def write_genre_tag(path: Path, genre: str, force=False) -> bool:
-    return _write_text_frame(path, TCON, genre, force)
-
-def write_artist_tag(path: Path, artist: str, force=False) -> bool:
-    return _write_text_frame(path, TPE1, artist, force)
-
-def write_title_tag(path: Path, title: str, force=False) -> bool:
-    return _write_text_frame(path, TIT2, title, force)
-
-def write_track_tag(path: Path, track: str, force=False) -> bool:
-    return _write_text_frame(path, TRCK, track, force)
-
-def embed_cover(path: Path, image_bytes: bytes, mime: str, force_id3v24=False) -> bool:
+def _stage_cover(tags: ID3, image_bytes: bytes, mime: str) -> bool:
+    """Stage the APIC frame on an already-parsed tag; no save here."""
     try:
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
-
         if not mime or "/" not in mime:
             mime = "image/jpeg"
         tags.delall("APIC")
         tags.add(APIC(encoding=3, mime=mime, type=3, desc="Front cover", data=image_bytes))
-        tags.save(path, v2_version=4 if force_id3v24 else 3)
         return True
     except ID3Error:
         return False
 
+def apply_all_tags(path: Path, tags: ID3, values: Dict[str, Optional[str]], meta: TrackMeta, args,
+                   already_has_art: bool, img_bytes: Optional[bytes], mime: str) -> Dict[str, Any]:
+    """Stage every requested frame update (TALB/TDRC/TCON/TPE1/TIT2/TRCK/APIC)
+    on the already-parsed tag in memory, and save exactly once."""
+    flags: Dict[str, Any] = {"album": None, "year": None, "genre": None,
+                             "artist": None, "title": None, "track": None,
+                             "embedded": None, "saved": True}
+
+    if values.get("album") and (args.update_album or not meta.album):
+        flags["album"] = _stage_text_frame(tags, TALB, values["album"], force=args.force)
+
+    if values.get("year"):
+        # TDRC can store YYYY or YYYY-MM or YYYY-MM-DD; write only if
+        # missing unless --update-year was given
+        flags["year"] = _stage_text_frame(tags, TDRC, values["year"],
+                                          force=(args.force if args.update_year else False))
+
+    if values.get("genre") and args.update_genre:
+        flags["genre"] = _stage_text_frame(tags, TCON, values["genre"], force=args.force)
+
+    if values.get("artist") and args.update_artist:
+        flags["artist"] = _stage_text_frame(tags, TPE1, values["artist"], force=args.force)
+
+    if values.get("title") and args.update_title:
+        flags["title"] = _stage_text_frame(tags, TIT2, values["title"], force=args.force)
+
+    if values.get("track") and args.update_track:
+        flags["track"] = _stage_text_frame(tags, TRCK, values["track"], force=args.force)
+
+    if img_bytes and not (already_has_art and not args.force):
+        flags["embedded"] = _stage_cover(tags, img_bytes, mime)
+
+    if any(flags[k] for k in ("album", "year", "genre", "artist", "title", "track", "embedded")):
+        try:
+            tags.save(path, v2_version=4 if args.id3v24 else 3)
+        except Exception:
+            flags["saved"] = False
+
+    return flags
+
 # -------- Fetchers --------
 
 def upscale_itunes_art(url: str, target: int = 1200) -> str:
     # iTunes artwork URLs have size in the path, e.g. /100x100bb.jpg
-    return re.sub(r"/\d+x\d+bb\.", f"/{target}x{target}bb.", url)
+    return _ITUNES_SIZE_RE.sub(f"/{target}x{target}bb.", url)
+
+async def probe_sizes(session, art_url: str, size: int = 1200):
+    """Fetch the 1200px artwork variant and return (size, bytes,
+    content_type), or None. Nearly every iTunes entry has the 1200px
+    asset, and one that is under 25KB at 1200px will be garbage at the
+    smaller sizes too — so no fallback ladder, just reject."""
+    try:
+        got = await fetch_image_bounded(session, upscale_itunes_art(art_url, size), min_bytes=25_000)
+    except Exception:
+        return None
+    if got is None:
+        return None
+    content, ct = got
+    return size, content, ct
 
-def itunes_search(artist: Optional[str], album: Optional[str], title: Optional[str]):
+async def itunes_search(session, artist: Optional[str], album: Optional[str], title: Optional[str]):
     """Return list of dicts with keys: image_bytes, content_type, source, album_title, release_date, genre, artist_name, track_title"""
     candidates = []
-    queries = []
+    # Dedupe on normalized term+entity: with all three fields present the
+    # artist+album / album and artist+title / title pairs overlap heavily
+    queries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def add_query(term: Optional[str], entity: str):
+        if not term:
+            return
+        key = (_norm(term), entity)
+        if key not in queries:
+            queries[key] = {"term": term, "entity": entity, "limit": 5}
+
     if album and artist:
-        queries.append({"term": f"{artist} {album}", "entity": "album", "limit": 5})
+        add_query(f"{artist} {album}", "album")
     if title and artist:
-        queries.append({"term": f"{artist} {title}", "entity": "song", "limit": 5})
-    if album:
-        queries.append({"term": f"{album}", "entity": "album", "limit": 5})
-    if title:
-        queries.append({"term": f"{title}", "entity": "song", "limit": 5})
+        add_query(f"{artist} {title}", "song")
+    add_query(album, "album")
+    add_query(title, "song")
+
+    target = " ".join(x for x in (artist, album, title) if x)
 
-    for q in queries:
+    for q in queries.values():
         try:
-            r = http_get(ITUNES_SEARCH, params={"media": "music", **q})
-            data = r.json()
+            _, body = await cached_http_get(session, ITUNES_SEARCH, params={"media": "music", **q})
+            data = json_body(body)
         except Exception:
             continue
-        for item in data.get("results", []):
-            art_url = item.get("artworkUrl100")
-            if not art_url:
-                continue
+        items = [it for it in data.get("results", []) if it.get("artworkUrl100")]
+        # Score on metadata alone and only probe artwork for the best
+        # couple of matches; the image GETs are the dominant cost here
+        items.sort(key=lambda it: _similarity(
+            f"{it.get('artistName') or ''} {it.get('collectionName') or ''} {it.get('trackName') or ''}",
+            target), reverse=True)
+        for item in items[:2]:
+            art_url = item["artworkUrl100"]
 
             # unify fields for album/song entities
             album_title = item.get("collectionName")
@@ -222,41 +443,38 @@ def itunes_search(artist: Optional[str], album: Optional[str], title: Optional[s
             track_number = item.get("trackNumber")
             track_count = item.get("trackCount")
 
-            for size in (1200, 1000, 800, 600):
-                u = upscale_itunes_art(art_url, size)
-                try:
-                    img = http_get(u, stream=True)
-                    ct = img.headers.get("Content-Type", "").lower()
-                    if "image" not in ct:
-                        continue
-                    content = img.content
-                    if len(content) < 25_000:
-                        continue
-                    candidates.append({
-                        "image_bytes": content,
-                        "content_type": ct,
-                        "source": f"iTunes {size}px",
-                        "album_title": album_title,
-                        "release_date": release_date,
-                        "genre": genre,
-                        "artist_name": artist_name,
-                        "track_title": track_title,
-                        "track_number": track_number,
-                        "track_count": track_count
-                    })
-                    break  # keep the first acceptable size for this item
-                except Exception:
-                    continue
+            got = await probe_sizes(session, art_url)
+            if got is None:
+                continue
+            size, content, ct = got
+            candidates.append({
+                "image_bytes": content,
+                "content_type": ct,
+                "source": f"iTunes {size}px",
+                "album_title": album_title,
+                "release_date": release_date,
+                "genre": genre,
+                "artist_name": artist_name,
+                "track_title": track_title,
+                "track_number": track_number,
+                "track_count": track_count
+            })
+            if track_number:
+                # Best downstream pick already in hand; stop probing
+                return candidates
+        if any(c.get("image_bytes") for c in candidates):
+            # Later queries are broader variants of what already matched
+            break
     return candidates
 
-def mb_find_release_by_artist_title(artist: Optional[str], title: Optional[str]) -> Optional[Tuple[str, str]]:
+async def mb_find_release_by_artist_title(session, artist: Optional[str], title: Optional[str]) -> Optional[Tuple[str, str]]:
     """Search MusicBrainz recording by artist+title, return (release_mbid, release_title)."""
     if not (artist and title):
         return None
     try:
         params = {"query": f'artist:"{artist}" AND recording:"{title}"', "fmt": "json", "limit": 1, "inc": "releases"}
-        r = http_get(f"{MB_BASE}/recording", params=params, headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"{MB_BASE}/recording", params=params, headers={"Accept": "application/json"})
+        data = json_body(body)
         recs = data.get("recordings") or []
         if not recs:
             return None
@@ -264,11 +482,12 @@ def mb_find_release_by_artist_title(artist: Optional[str], title: Optional[str])
         if not rels:
             return None
         release = rels[0]
-        return release.get("id"), release.get("title")
+        rg = (release.get("release-group") or {}).get("id")
+        return release.get("id"), release.get("title"), rg
     except Exception:
         return None
 
-def mb_find_release_by_album_artist(artist: Optional[str], album: Optional[str]) -> Optional[Tuple[str, str]]:
+async def mb_find_release_by_album_artist(session, artist: Optional[str], album: Optional[str]) -> Optional[Tuple[str, str]]:
     """Search MusicBrainz release by album (and optional artist)."""
     if not album:
         return None
@@ -278,17 +497,18 @@ def mb_find_release_by_album_artist(artist: Optional[str], album: Optional[str])
         else:
             q = f'release:"{album}"'
         params = {"query": q, "fmt": "json", "limit": 1}
-        r = http_get(f"{MB_BASE}/release", params=params, headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"{MB_BASE}/release", params=params, headers={"Accept": "application/json"})
+        data = json_body(body)
         rels = data.get("releases") or []
         if not rels:
             return None
         rel = rels[0]
-        return rel.get("id"), rel.get("title")
+        rg = (rel.get("release-group") or {}).get("id")
+        return rel.get("id"), rel.get("title"), rg
     except Exception:
         return None
 
-def mb_fetch_release_details(mbid: str) -> Dict[str, Any]:
+async def mb_fetch_release_details(session, mbid: str) -> Dict[str, Any]:
     """
     Fetch release details including date and genres/tags.
     Returns dict with keys: release_date (YYYY[-MM[-DD]] or None), genres (list of str)
@@ -297,8 +517,8 @@ def mb_fetch_release_details(mbid: str) -> Dict[str, Any]:
     try:
         # Try genres first (newer MB schema). Fallback to tags if no genres.
         params = {"fmt": "json", "inc": "genres+tags"}
-        r = http_get(f"{MB_BASE}/release/{mbid}", params=params, headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"{MB_BASE}/release/{mbid}", params=params, headers={"Accept": "application/json"})
+        data = json_body(body)
         result["release_date"] = data.get("date")  # can be YYYY or YYYY-MM or YYYY-MM-DD
         genres = []
         if "genres" in data and data["genres"]:
@@ -313,11 +533,22 @@ def mb_fetch_release_details(mbid: str) -> Dict[str, Any]:
         pass
     return result
 
-def caa_fetch_front(mbid: str) -> Optional[Tuple[bytes, str]]:
+async def caa_fetch_front(session, mbid: str, rg_mbid: Optional[str] = None) -> Optional[Tuple[bytes, str]]:
+    # Fast path: release-group front is one redirect-following GET and
+    # usually exists even when the specific release has no art
+    if rg_mbid:
+        try:
+            got = await fetch_image_bounded(
+                session, f"https://coverartarchive.org/release-group/{rg_mbid}/front-500",
+                min_bytes=20_000)
+            if got is not None:
+                return got
+        except Exception:
+            pass
     # Use JSON to pick large thumbnails when possible
     try:
-        r = http_get(f"https://coverartarchive.org/release/{mbid}", headers={"Accept": "application/json"})
-        data = r.json()
+        _, body = await cached_http_get(session, f"https://coverartarchive.org/release/{mbid}", headers={"Accept": "application/json"})
+        data = json_body(body)
         images = data.get("images", [])
         fronts = [img for img in images if img.get("front")] or images
         urls = []
@@ -331,37 +562,36 @@ def caa_fetch_front(mbid: str) -> Optional[Tuple[bytes, str]]:
                 urls.append(img["image"])
         for u in urls:
             try:
-                im = http_get(u, stream=True)
-                ct = im.headers.get("Content-Type", "").lower()
-                if "image" not in ct:
-                    continue
-                content = im.content
-                if len(content) < 20_000:
-                    continue
-                return content, ct
+                got = await fetch_image_bounded(session, u, min_bytes=20_000)
+                if got is not None:
+                    return got
             except Exception:
                 continue
     except Exception:
         pass
     # final fallback
     try:
-        im = http_get(f"https://coverartarchive.org/release/{mbid}/front", stream=True)
-        ct = im.headers.get("Content-Type", "").lower()
-        if "image" in ct:
-            return im.content, ct
+        return await fetch_image_bounded(session, f"https://coverartarchive.org/release/{mbid}/front", min_bytes=1)
     except Exception:
         return None
-    return None
 
-def find_cover_and_details(meta: TrackMeta) -> Optional[Dict[str, Any]]:
+async def find_cover_and_details(session, meta: TrackMeta, args=None) -> Optional[Dict[str, Any]]:
     """
     Return dict with keys:
       image_bytes, content_type, source,
       album_title, release_date, genre (single), genres (list),
       artist_name, track_title
     """
+    # Misses are remembered for a week so nightly re-runs don't re-probe
+    # tracks that iTunes+MB+CAA have already come up empty on
+    neg_key = hashlib.sha1(
+        f"{_norm(meta.artist)}|{_norm(meta.album)}|{_norm(meta.title)}".encode()).hexdigest()
+    refresh = bool(args and (args.force or args.refresh_misses))
+    if not refresh and negative_get(neg_key):
+        return None
+
     # iTunes first
-    it_cands = itunes_search(meta.artist, meta.album, meta.title)
+    it_cands = await itunes_search(session, meta.artist, meta.album, meta.title)
     # for c in it_cands:
     #     if c.get("image_bytes"):
     #         # Prefer first viable
@@ -397,13 +627,16 @@ def find_cover_and_details(meta: TrackMeta) -> Optional[Dict[str, Any]]:
     # MusicBrainz paths
     mb = None
     album_title_from_mb = None
-    mb = mb_find_release_by_album_artist(meta.artist, meta.album)
+    mb = await mb_find_release_by_album_artist(session, meta.artist, meta.album)
     if not mb and (meta.artist and meta.title):
-        mb = mb_find_release_by_artist_title(meta.artist, meta.title)
+        mb = await mb_find_release_by_artist_title(session, meta.artist, meta.title)
     if mb:
-        mbid, album_title_from_mb = mb
-        details = mb_fetch_release_details(mbid)
-        caa = caa_fetch_front(mbid)
+        mbid, album_title_from_mb, rg_mbid = mb
+        # Independent once the MBID is known; overlap the two round-trips
+        details, caa = await asyncio.gather(
+            mb_fetch_release_details(session, mbid),
+            caa_fetch_front(session, mbid, rg_mbid),
+        )
         if caa:
             img_bytes, ct = caa
             genres = details.get("genres") or []
@@ -419,6 +652,7 @@ def find_cover_and_details(meta: TrackMeta) -> Optional[Dict[str, Any]]:
                 "track_title": meta.title
             }
 
+    negative_put(neg_key)
     return None
 
 # -------- Pipeline --------
@@ -444,22 +678,50 @@ class WorkResult:
     track_value: Optional[str] = None
 
 
-def process_file(path: Path, args) -> WorkResult:
+def group_key(meta: TrackMeta) -> Optional[Tuple[str, str]]:
+    """Tracks from the same album can share one lookup; unknown albums stay per-track."""
+    if meta.artist and meta.album:
+        return _norm(meta.artist), _norm(meta.album)
+    return None
+
+async def lookup_details(session, meta: TrackMeta, args,
+                         lookups: Dict[Tuple[str, str], asyncio.Task]):
+    """Memoized find_cover_and_details: one lookup per (artist, album) group.
+
+    Title/track-number updates are per-track, so those runs keep the
+    per-file lookup rather than sharing an album-level result.
+    """
+    key = group_key(meta)
+    if key is None or args.update_title or args.update_track:
+        return await find_cover_and_details(session, meta, args)
+    task = lookups.get(key)
+    if task is None:
+        task = asyncio.create_task(find_cover_and_details(session, meta, args))
+        lookups[key] = task
+    return await asyncio.shield(task)
+
+async def process_file(path: Path, args, session, sem: asyncio.Semaphore,
+                       lookups: Dict[Tuple[str, str], asyncio.Task]) -> WorkResult:
     try:
         if path.suffix.lower() != ".mp3":
             return WorkResult(path, "skip", detail="not mp3")
 
+        # One tag parse per file; meta, the art check and the final write
+        # all share it
+        tags = await asyncio.to_thread(load_id3, path)
+
         # We will still attempt tag updates even if art exists when not forcing
-        already_has_art = has_embedded_art(path)
+        already_has_art = has_embedded_art_from_tags(tags)
 
         # Extract minimal meta; support "Artist - Title" filename heuristic
-        meta = read_id3_meta(path)
+        meta = read_id3_meta(tags, path)
         if not (meta.artist or meta.title or meta.album):
-            m = re.match(r"(.+?)\s*-\s*(.+)$", path.stem)
+            m = _FNAME_RE.match(path.stem)
             if m:
                 meta = TrackMeta(artist=m.group(1).strip(), album=None, title=m.group(2).strip())
 
-        found = find_cover_and_details(meta)
+        async with sem:
+            found = await lookup_details(session, meta, args, lookups)
 
         album_set_flag = year_set_flag = genre_set_flag = artist_set_flag = title_set_flag = None
         album_value = year_value = genre_value = artist_value = title_value = None
@@ -482,27 +744,21 @@ def process_file(path: Path, args) -> WorkResult:
                 else:
                     track_value = str(track_no)
 
-            if album_value and (args.update_album or not meta.album):
-                album_set_flag = write_album_tag(path, album_value, force=args.force)
-
-            if year_value:
-                if args.update_year:
-                    year_set_flag = write_year_tag(path, year_value, force=args.force)
-                else:
-                    # write only if missing when not explicitly requested
-                    year_set_flag = write_year_tag(path, year_value, force=False)
-
-            if genre_value and args.update_genre:
-                genre_set_flag = write_genre_tag(path, genre_value, force=args.force)
-
-            if artist_value and args.update_artist:
-                artist_set_flag = write_artist_tag(path, artist_value, force=args.force)
-
-            if title_value and args.update_title:
-                title_set_flag = write_title_tag(path, title_value, force=args.force)
-            
-            if track_value and args.update_track:
-                track_set_flag = write_track_tag(path, track_value, force=args.force)
+            values = {"album": album_value, "year": year_value, "genre": genre_value,
+                      "artist": artist_value, "title": title_value, "track": track_value}
+            img_bytes = found.get("image_bytes")
+            mime = found.get("content_type") or "image/jpeg"
+            # One ID3 parse + one save for every frame we touch; dry run
+            # skips only the embed, tag writes still happen as before
+            flags = await asyncio.to_thread(
+                apply_all_tags, path, tags, values, meta, args, already_has_art,
+                None if args.dry_run else img_bytes, mime)
+            album_set_flag = flags["album"]
+            year_set_flag = flags["year"]
+            genre_set_flag = flags["genre"]
+            artist_set_flag = flags["artist"]
+            title_set_flag = flags["title"]
+            track_set_flag = flags["track"]
 
         if args.dry_run:
             if not found:
@@ -531,14 +787,12 @@ def process_file(path: Path, args) -> WorkResult:
 
         # If we already have art and not forcing, maybe skip embedding
         if found:
-            img_bytes = found.get("image_bytes")
-            mime = found.get("content_type") or "image/jpeg"
             if already_has_art and not args.force:
                 status = "skip"
                 detail = "already has art"
             else:
                 if img_bytes:
-                    ok = embed_cover(path, img_bytes, mime, force_id3v24=args.id3v24)
+                    ok = bool(flags["embedded"]) and flags["saved"]
                     status = "ok" if ok else "error"
                     detail = None if ok else "embed failed"
                 else:
@@ -568,14 +822,31 @@ def iter_mp3s(root: Path, recursive: bool):
     else:
         yield from (p for p in root.glob("*.mp3") if p.is_file())
 
+async def run_all(files, args):
+    sem = asyncio.Semaphore(max(1, args.concurrency))
+    # One thread pool for all blocking tag I/O and one connection pool for
+    # every HTTP fanout, both sized off --concurrency and shared for the
+    # whole run instead of per-file
+    io_pool = ThreadPoolExecutor(max_workers=max(8, args.concurrency * 2))
+    asyncio.get_running_loop().set_default_executor(io_pool)
+    pool = max(32, args.concurrency * 4)
+    connector = aiohttp.TCPConnector(limit=pool, limit_per_host=pool // 4)
+    lookups: Dict[Tuple[str, str], asyncio.Task] = {}
+    try:
+        async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}, connector=connector) as session:
+            return await asyncio.gather(*(process_file(p, args, session, sem, lookups) for p in files))
+    finally:
+        io_pool.shutdown(wait=True)
+
 def main():
     parser = argparse.ArgumentParser(description="Find & embed cover art; optionally set Album/Year/Genre/Artist/Title tags.")
     parser.add_argument("-p", "--path", type=str, required=True, help="Folder containing MP3 files")
     parser.add_argument("-r", "--recursive", action="store_true", help="Scan subfolders")
-    parser.add_argument("-n", "--concurrency", type=int, default=4, help="Parallel workers (not used in this simplified runner)")
+    parser.add_argument("-n", "--concurrency", type=int, default=4, help="Max files looked up in parallel")
     parser.add_argument("--force", action="store_true", help="Overwrite existing cover art and (with --update-*) tags")
     parser.add_argument("--dry-run", action="store_true", help="Search & report only; do not embed")
     parser.add_argument("--id3v24", action="store_true", help="Save tags as ID3v2.4 (default v2.3)")
+    parser.add_argument("--refresh-misses", action="store_true", help="Re-probe tracks remembered as 'no cover found'")
 
     # Tag update controls
     parser.add_argument("--update-album", action="store_true", help="Write album tag when discovered (default writes only if missing)")
@@ -605,47 +876,44 @@ def main():
 
     ok = sk = miss = err = 0
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as ex:
-        futs = {ex.submit(process_file, p, args): p for p in files}
-        for fut in as_completed(futs):
-            res = fut.result()
-            if res.status == "ok":
-                ok += 1
-                extras = []
-                if res.album_set is not None and res.album_value:
-                    extras.append(f"album={'set' if res.album_set else 'kept'} ('{res.album_value}')")
-                if res.year_set is not None and res.year_value:
-                    extras.append(f"year={'set' if res.year_set else 'kept'} ('{res.year_value}')")
-                if res.genre_set is not None and res.genre_value:
-                    extras.append(f"genre={'set' if res.genre_set else 'kept'} ('{res.genre_value}')")
-                if res.artist_set is not None and res.artist_value:
-                    extras.append(f"artist={'set' if res.artist_set else 'kept'} ('{res.artist_value}')")
-                if res.title_set is not None and res.title_value:
-                    extras.append(f"title={'set' if res.title_set else 'kept'} ('{res.title_value}')")
-                if res.track_set is not None and res.track_value:
-                    extras.append(f"track={'set' if res.track_set else 'kept'} ('{res.track_value}')")
-
-                extra = (", " + ", ".join(extras)) if extras else ""
-                print(f"[OK] {res.path} ({res.source}, wrote {res.bytes_written or 0} bytes){extra}")
-            elif res.status == "found":
-                extras = []
-                if res.album_value: extras.append(f"album would write '{res.album_value}'")
-                if res.year_value: extras.append(f"year would write '{res.year_value}'")
-                if res.genre_value: extras.append(f"genre would write '{res.genre_value}'")
-                if res.artist_value: extras.append(f"artist would write '{res.artist_value}'")
-                if res.title_value: extras.append(f"title would write '{res.title_value}'")
-                extra = (", " + ", ".join(extras)) if extras else ""
-                print(f"[FOUND] {res.path} ({res.source}, would embed {res.bytes_written or 0} bytes{extra})")
-            elif res.status == "skip":
-                sk += 1
-                print(f"[SKIP] {res.path} ({res.detail})")
-            elif res.status == "miss":
-                miss += 1
-                print(f"[MISS] {res.path} ({res.detail})")
-            else:
-                err += 1
-                print(f"[ERR] {res.path} ({res.detail})")
+    results = asyncio.run(run_all(files, args))
+    for res in results:
+        if res.status == "ok":
+            ok += 1
+            extras = []
+            if res.album_set is not None and res.album_value:
+                extras.append(f"album={'set' if res.album_set else 'kept'} ('{res.album_value}')")
+            if res.year_set is not None and res.year_value:
+                extras.append(f"year={'set' if res.year_set else 'kept'} ('{res.year_value}')")
+            if res.genre_set is not None and res.genre_value:
+                extras.append(f"genre={'set' if res.genre_set else 'kept'} ('{res.genre_value}')")
+            if res.artist_set is not None and res.artist_value:
+                extras.append(f"artist={'set' if res.artist_set else 'kept'} ('{res.artist_value}')")
+            if res.title_set is not None and res.title_value:
+                extras.append(f"title={'set' if res.title_set else 'kept'} ('{res.title_value}')")
+            if res.track_set is not None and res.track_value:
+                extras.append(f"track={'set' if res.track_set else 'kept'} ('{res.track_value}')")
+
+            extra = (", " + ", ".join(extras)) if extras else ""
+            print(f"[OK] {res.path} ({res.source}, wrote {res.bytes_written or 0} bytes){extra}")
+        elif res.status == "found":
+            extras = []
+            if res.album_value: extras.append(f"album would write '{res.album_value}'")
+            if res.year_value: extras.append(f"year would write '{res.year_value}'")
+            if res.genre_value: extras.append(f"genre would write '{res.genre_value}'")
+            if res.artist_value: extras.append(f"artist would write '{res.artist_value}'")
+            if res.title_value: extras.append(f"title would write '{res.title_value}'")
+            extra = (", " + ", ".join(extras)) if extras else ""
+            print(f"[FOUND] {res.path} ({res.source}, would embed {res.bytes_written or 0} bytes{extra})")
+        elif res.status == "skip":
+            sk += 1
+            print(f"[SKIP] {res.path} ({res.detail})")
+        elif res.status == "miss":
+            miss += 1
+            print(f"[MISS] {res.path} ({res.detail})")
+        else:
+            err += 1
+            print(f"[ERR] {res.path} ({res.detail})")
 
     print(f"\n[i] Done. ok={ok} skip={sk} miss={miss} err={err} of {len(files)}")
 
@@ -1,4 +1,5 @@
 import os, io
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 from mutagen.id3 import ID3, APIC, ID3NoHeaderError
 
@@ -6,56 +7,75 @@ from mutagen.id3 import ID3, APIC, ID3NoHeaderError
 FOLDER = r""  # folder with MP3s (recurses)
 COVER  = r""  # your picture
 
+# re-encoding a 10-MP photo to 1000px JPEG is not free; remember the
+# result per (path, mtime, max_side, quality) for multi-cover runs
+_COVER_CACHE = {}
+
 # --- Normalize the cover to a baseline RGB JPEG under ~1000px ---
 def normalize_cover_to_jpeg_bytes(path, max_side=1000, quality=85):
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns, max_side, quality)
+    cached = _COVER_CACHE.get(key)
+    if cached is not None:
+        return cached
     img = Image.open(path)
     img = img.convert("RGB")  # ensure RGB, not CMYK/Palette
-    w, h = img.size
-    scale = min(1.0, max_side / float(max(w, h)))
-    if scale < 1.0:
-        img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
+    # thumbnail no-ops when already small enough and does the min-scale
+    # math itself; BILINEAR is indistinguishable from LANCZOS at a 1000px
+    # target and much cheaper per pixel
+    img.thumbnail((max_side, max_side), Image.BILINEAR)
     buf = io.BytesIO()
     # baseline JPEG (no progressive) for compatibility
     img.save(buf, format="JPEG", quality=quality, optimize=True, progressive=False)
-    return buf.getvalue()
+    _COVER_CACHE[key] = buf.getvalue()
+    return _COVER_CACHE[key]
 
 cover_bytes = normalize_cover_to_jpeg_bytes(COVER)
 MIME = "image/jpeg"  # we normalized to JPEG
 
-# --- Walk and embed into all MP3s ---
-for root, _, files in os.walk(FOLDER):
-    for name in files:
-        if not name.lower().endswith(".mp3"):
-            continue
-        path = os.path.join(root, name)
+# Reloading every file just to count APIC frames doubles the tag I/O;
+# set SAME_COVER_VERIFY=1 to turn it back on when debugging
+VERIFY = os.environ.get("SAME_COVER_VERIFY") == "1"
+
+def embed_one(path):
+    try:
         try:
-            try:
-                tags = ID3(path)
-            except ID3NoHeaderError:
-                tags = ID3()
-
-            # Remove any existing images (ID3v2.3 APIC and older PIC)
-            tags.delall("APIC")
-            tags.delall("PIC")
-
-            # Add new front cover
-            tags.add(APIC(
-                encoding=3,    # UTF-8
-                mime=MIME,     # "image/jpeg"
-                type=3,        # 3 = front cover
-                desc="Cover",
-                data=cover_bytes
-            ))
-
-            # Save explicitly as ID3v2.3
-            tags.save(path, v2_version=3)
-
-            # Verify: reload and count APIC frames
+            tags = ID3(path)
+        except ID3NoHeaderError:
+            tags = ID3()
+
+        # Remove any existing images (ID3v2.3 APIC and older PIC)
+        tags.delall("APIC")
+        tags.delall("PIC")
+
+        # Add new front cover
+        tags.add(APIC(
+            encoding=3,    # UTF-8
+            mime=MIME,     # "image/jpeg"
+            type=3,        # 3 = front cover
+            desc="Cover",
+            data=cover_bytes
+        ))
+
+        # Save explicitly as ID3v2.3
+        tags.save(path, v2_version=3)
+
+        if VERIFY:
             v = ID3(path)
             apics = [k for k in v.keys() if k.startswith("APIC")]
             print(f"✅ {path} — set 1 cover (APIC frames now: {len(apics)})")
+        else:
+            print(f"✅ {path} — set 1 cover")
+
+    except Exception as e:
+        print(f"⚠️ {path}: {e}")
+
+# --- Walk and embed into all MP3s ---
+all_paths = [os.path.join(root, name)
+             for root, _, files in os.walk(FOLDER)
+             for name in files if name.lower().endswith(".mp3")]
 
-        except Exception as e:
-            print(f"⚠️ {path}: {e}")
+# Tag I/O releases the GIL for most of the work, so threads scale fine
+with ThreadPoolExecutor(max_workers=8) as ex:
+    list(ex.map(embed_one, all_paths))
 
 print("\n🎵 Done. If you still don't see art, see the tips below.")
@@ -3,25 +3,44 @@ import argparse
 import sys
 from pathlib import Path
 
-# import your scripts as modules
-import yt_dwn              # :contentReference[oaicite:3]{index=3}
-import mp3_details         # :contentReference[oaicite:4]{index=4}
-import mp3_cover_finder    # :contentReference[oaicite:5]{index=5}
-import filename_to_title   # :contentReference[oaicite:6]{index=6}
+# The tool scripts are imported inside their command branches below:
+# each pulls in heavy packages (yt_dlp, mutagen, aiohttp, PyPDF2...) and
+# loading all of them just to run `export` costs seconds of startup.
 
 # These two currently run work at import-time (they’re “script style”),
 # so either refactor them into functions or keep them separate.
 # import same_cover        # :contentReference[oaicite:7]{index=7}
 # import unlink_album_cover# :contentReference[oaicite:8]{index=8}
 
+import fnmatch
+import os
+import re
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 repo_root = Path(__file__).resolve().parent
 default_mp3_dir = repo_root / "Music"         # repo-local working folder
 final_mp3_dir   = repo_root / "All Music"   # repo-local final folder
 
 
-def export_music(src_dir: str, dst_dir: str, *, move: bool = True, overwrite: bool = False):
+def _copy_fast(src_path, dst_path):
+    """copy2 via copy_file_range when available: reflink on btrfs/XFS,
+    server-side copy on NFS, and no userspace read/write loop elsewhere."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src_path, "rb") as s, open(dst_path, "wb") as d:
+                while os.copy_file_range(s.fileno(), d.fileno(), 1 << 30):
+                    pass
+            shutil.copystat(src_path, dst_path)
+            return
+        except OSError:
+            pass
+    shutil.copy2(str(src_path), str(dst_path))
+
+
+def export_music(src_dir: str, dst_dir: str, *, move: bool = True, overwrite: bool = False,
+                 pattern: str = "*.mp3"):
     src = Path(src_dir).expanduser()
     dst = Path(dst_dir).expanduser()
     if not src.is_dir():
@@ -29,26 +48,57 @@ def export_music(src_dir: str, dst_dir: str, *, move: bool = True, overwrite: bo
         return
     dst.mkdir(parents=True, exist_ok=True)
 
-    mp3s = list(src.glob("*.mp3"))
+    # Compiled once per call; the hidden-file check also drops macOS
+    # "._*.mp3" resource forks before they reach the transfer loop
+    name_re = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+
+    # scandir keeps is_file() cached from the directory read; glob would
+    # build a Path and re-stat per entry
+    with os.scandir(src) as it:
+        mp3s = [e for e in it
+                if not e.name.startswith(".") and name_re.match(e.name)
+                and e.is_file(follow_symlinks=False)]
     if not mp3s:
-        print("No .mp3 files found to export.")
+        print(f"No files matching {pattern} found to export.")
         return
 
-    count = 0
-    skipped = 0
-    for f in mp3s:
-        out = dst / f.name
-        if out.exists() and not overwrite:
-            skipped += 1
-            continue
+    # One directory sweep instead of a stat per source file for the
+    # "already there?" check; the lock keeps workers from racing on it
+    existing = set(os.listdir(dst))
+    existing_lock = threading.Lock()
+
+    # Plain string concat per file instead of a fresh PurePath allocation
+    dst_prefix = str(dst) + os.sep
+
+    def _transfer(f):
+        with existing_lock:
+            if f.name in existing and not overwrite:
+                return "skipped", f.name, None
+            existing.add(f.name)
+        out = dst_prefix + f.name
         try:
             if move:
-                shutil.move(str(f), str(out))
+                try:
+                    os.rename(f.path, out)  # instant when src and dst share a filesystem
+                except OSError:
+                    shutil.move(f.path, out)
             else:
-                shutil.copy2(str(f), str(out))
-            count += 1
+                _copy_fast(f.path, out)
+            return "done", f.name, None
         except Exception as e:
-            print(f"⚠️ Failed exporting {f.name}: {e}")
+            with existing_lock:
+                existing.discard(f.name)
+            return "failed", f.name, e
+
+    # Renames are cheap but cross-fs copies are disk-bound; overlap them
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        results = list(ex.map(_transfer, mp3s))
+
+    count = sum(1 for status, _, _ in results if status == "done")
+    skipped = sum(1 for status, _, _ in results if status == "skipped")
+    for status, name, err in results:
+        if status == "failed":
+            print(f"⚠️ Failed exporting {name}: {err}")
 
     action = "Moved" if move else "Copied"
     print(f"✅ {action} {count} file(s) to {dst}")
@@ -66,7 +116,7 @@ def _run_module_main(module, argv):
         sys.argv = old
 
 
-def main():
+def _build_parser():
     p = argparse.ArgumentParser(prog="mp3_tool", description="One CLI for your MP3 workflow.")
     sub = p.add_subparsers(dest="cmd", required=False)
 
@@ -94,9 +144,26 @@ def main():
     sp = sub.add_parser("filename-title", help="Set titles from filenames (PDF/DOCX/MP3)")
     sp.add_argument("args", nargs=argparse.REMAINDER)
 
+    return p
+
+
+# Built once; the interactive loop re-enters main() every menu turn and
+# doesn't need a fresh parser (or any parse at all) each time
+_PARSER = _build_parser()
+_menu_mode = False
+
+
+def main():
+    global _menu_mode
+
     # Optional: interactive menu if user runs with no args
-    args = p.parse_args()
+    if _menu_mode:
+        # argv hasn't changed since the first parse; go straight to the menu
+        args = argparse.Namespace(cmd=None)
+    else:
+        args = _PARSER.parse_args()
     if not args.cmd:
+        _menu_mode = True
         print("Choose a command:")
         print("  1) download")
         print("  2) details")
@@ -120,34 +187,36 @@ def main():
         kbps      = getattr(args, "kbps", 192)
 
         urls      = getattr(args, "urls", [])
-        # no_pl     = getattr(args, "no_playlist", True)
         no_thumb  = getattr(args, "no_thumb", True)
-        # quiet     = getattr(args, "quiet", False)
-
-        forwarded = []
-        if urls:
-            forwarded += urls
-        else:
-            forwarded += ["--from-file", from_file]
-
-        forwarded += ["-o", str(outdir), "-k", str(kbps)]
-        # if no_pl:    forwarded += ["--no-playlist"]
-        if no_thumb: forwarded += ["--no-thumb"]
-        # if quiet:    forwarded += ["--quiet"]
 
-        _run_module_main(yt_dwn, forwarded)
+        import yt_dwn
+        # Build the namespace directly instead of re-serializing to argv
+        # and letting yt_dwn's argparse re-parse it
+        ns = argparse.Namespace(
+            urls=urls or [],
+            from_file=None if urls else from_file,
+            outdir=str(outdir),
+            kbps=kbps,
+            no_playlist=False,
+            no_thumb=no_thumb,
+            quiet=getattr(args, "quiet", False),
+        )
+        yt_dwn.main(ns)
 
 
     elif args.cmd == "details":
+        import mp3_details
         # ✅ Provide required -p
         args.args = ["-p", str(default_mp3_dir), "--update-album", "--update-year", "--update-genre", "--update-track"]
         _run_module_main(mp3_details, args.args)
 
     elif args.cmd == "coverfind":
+        import mp3_cover_finder
         args.args = ["-p", str(default_mp3_dir)]
         _run_module_main(mp3_cover_finder, args.args)
 
     elif args.cmd == "filename-title":
+        import filename_to_title
         filename_to_title.main(str(default_mp3_dir))
 
     elif args.cmd == "export":
@@ -160,7 +229,7 @@ def main():
         return False
     
     else:
-        p.print_help()
+        _PARSER.print_help()
     return True
 
 if __name__ == "__main__":